@@ -104,7 +104,7 @@ class BaseAgent(ABC):
             ui = UIManager.init(options.userinterface, self.rb)
             ui.on_key_press(self._keypress_callback)
             self._timer_value = options.gui_timer_ms
-            self._pending_action_timer = ui.on_timer_end(self._timer_value, self._act_callback)
+            self._pending_action_timer = ui.on_timer_repeat(self._timer_value, self._act_callback)
             return ui
         return None
 
@@ -140,11 +140,16 @@ class BaseAgent(ABC):
             self.ui.start_ui()
         else:
             self.logger.log([Log('start', 'start')])
-            while self.rb.is_running():
-                terminal = self.act()
+            # bind the methods called at each step once
+            is_running = self.rb.is_running
+            act = self.act
+            game_over = self.game_over
+            while is_running():
+                terminal = act()
                 if terminal:
-                    self.game_over()
+                    game_over()
             self.logger.log([Log('exit', 'exit')])
+            self.logger.flush()
 
     def game_over(self):
         """Called each time a terminal state is reached.
@@ -171,7 +176,7 @@ class BaseAgent(ABC):
             self.ui.cancel_timer(self._pending_action_timer)
             self.rb.reset()
             self.ui.draw_from_rogue()
-            self._pending_action_timer = self.ui.on_timer_end(self._timer_value, self._act_callback)
+            self._pending_action_timer = self.ui.on_timer_repeat(self._timer_value, self._act_callback)
 
     def _act_callback(self):
         """Called every options.gui_timer_ms millisecods.
@@ -185,8 +190,6 @@ class BaseAgent(ABC):
         self.ui.draw_from_rogue()
         if self.rb.game_over() or terminal:
             self.game_over()
-        # renew the callback
-        self._pending_action_timer = self.ui.on_timer_end(self._timer_value, self._act_callback)
 
 
 class AgentWrapper(BaseAgent):
@@ -219,6 +222,12 @@ class AgentWrapper(BaseAgent):
         self.wrapped = wrappedAgent
         super().__init__(wrappedAgent.options)
 
+        # forwarding methods that are not overridden by the wrapper class are replaced by the wrapped agent's own
+        # bound methods, so that calling them does not go through an extra python frame
+        for name in ('act', 'game_over'):
+            if getattr(type(self), name) is getattr(AgentWrapper, name):
+                setattr(self, name, getattr(wrappedAgent, name))
+
     def _replace_timer_cb(self, ui=None):
         """
         Replaces the ui timer callback of the wrapped agent with the wrapper's callback
@@ -228,7 +237,7 @@ class AgentWrapper(BaseAgent):
         """
         ui = ui or self.ui
         ui.cancel_timer(self.wrapped._pending_action_timer)
-        self._pending_action_timer = ui.on_timer_end(self._timer_value, self._act_callback)
+        self._pending_action_timer = ui.on_timer_repeat(self._timer_value, self._act_callback)
 
     def _create_rogue(self, options):
         return self.wrapped.rb
@@ -344,9 +353,12 @@ class RecordingWrapper(AgentWrapper):
         """
         Records the current rogue frame on file in the directory specified during init
         """
-        screen = self.rb.get_screen()[:]
-        step = str(self.step_count)
-        step = '0' * (3 - len(step)) + step
-        fname = os.path.join(self.record_dir, 'ep%sst%s.txt' % (self.episode_index, step))
-        with open(fname, mode='w') as file:
-            print(*screen, sep='\n', file=file)
+        screen = self.rb.get_screen()
+        fname = os.path.join(self.record_dir, 'ep%sst%03d.txt' % (self.episode_index, self.step_count))
+        # write the whole frame with a single syscall
+        data = ('\n'.join(screen) + '\n').encode()
+        fd = os.open(fname, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
@@ -16,6 +16,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import collections
+import itertools
+import math
 
 
 class RogueEvaluator:
@@ -38,11 +40,38 @@ class RogueEvaluator:
         self.episodes_for_evaluation = episodes_for_evaluation or None
         self.episodes = collections.deque(maxlen=self.episodes_for_evaluation)  # type: deque[Episode]
         self.current_episode = None  # type: Episode
+        self._reset_sums()
 
     def reset(self):
         self.episodes.clear()
+        self._reset_sums()
         self.current_episode = None  # type: Episode
 
+    def _reset_sums(self):
+        """Resets the running sums of the stats of the collected episodes"""
+        self._wins = 0
+        self._reward_sum = 0
+        self._tiles_sum = 0
+        self._steps_sum = 0
+        self._win_steps_sum = 0
+        self._evictions = 0  # episodes discarded since the reward sum was last recomputed
+
+    def _accumulate(self, episode, sign):
+        """Adds (sign=1) or removes (sign=-1) the contribution of the given episode to the running sums
+
+        :param Episode episode:
+            episode whose stats should be accounted for
+        :param int sign:
+            1 if the episode is being added to the collection, -1 if it is being removed
+        """
+        self._reward_sum += sign * episode.total_reward
+        self._tiles_sum += sign * episode.final_tiles_count
+        self._steps_sum += sign * episode.steps
+        # won episodes contribute sign, the others 0
+        won = sign * bool(episode.won)
+        self._wins += won
+        self._win_steps_sum += won * episode.steps
+
     def on_run_begin(self):
         """Records the beginning of a run"""
         self.current_episode = Episode()
@@ -63,9 +92,10 @@ class RogueEvaluator:
         :return:
             True if the run should stop
         """
-        self.current_episode.steps += 1
-        self.current_episode.total_reward += reward
-        return self.current_episode.steps >= self.max_step_count
+        episode = self.current_episode
+        episode.steps = steps = episode.steps + 1
+        episode.total_reward += reward
+        return steps >= self.max_step_count
 
     def on_run_end(self, frame_history, won, is_rogue_dead):
         """Records the end of a run
@@ -90,7 +120,18 @@ class RogueEvaluator:
         :param Episode episode:
             episode to add to the collection
         """
+        if len(self.episodes) == self.episodes.maxlen:
+            # the oldest episode is about to be discarded
+            self._accumulate(self.episodes[0], -1)
+            self._evictions += 1
         self.episodes.append(episode)
+        self._accumulate(episode, 1)
+
+        if self._evictions == self.episodes.maxlen:
+            # rewards are floats: recompute their sum exactly once per full turnover of the window,
+            # so that rounding errors of the repeated additions and subtractions do not build up
+            self._evictions = 0
+            self._reward_sum = math.fsum(e.total_reward for e in self.episodes)
 
     def statistics(self):
         """
@@ -104,37 +145,23 @@ class RogueEvaluator:
              "win_steps_avg": float    # average number of steps taken in won episodes
             }
         """
-        result = {}
-        result["win_perc"] = 0
-        result["reward_avg"] = 0
-        result["tiles_avg"] = 0
-        result["all_steps_avg"] = 0
-        result["win_steps_avg"] = 0
-
-        evaluated_episodes = self.episodes
-        # accumulate stats for each episode
-        for e in evaluated_episodes:
-            result["reward_avg"] += e.total_reward
-            result["tiles_avg"] += e.final_tiles_count
-            result["all_steps_avg"] += e.steps
-            if e.won:
-                result["win_perc"] += 1
-                result["win_steps_avg"] += e.steps
-
-        # average stats across all episodes
-        n_episodes = len(evaluated_episodes)
-        if n_episodes > 0:
-            result["win_steps_avg"] /= max(result["win_perc"], 1)
-            result["win_perc"] /= n_episodes
-            result["all_steps_avg"] /= n_episodes
-            result["reward_avg"] /= n_episodes
-            result["tiles_avg"] /= n_episodes
-
-        return result
+        # averages are computed from the running sums kept up to date by ._add_episode()
+        # N.B. all sums are 0 when there are no episodes
+        n_episodes = max(len(self.episodes), 1)
+        return {
+            "win_perc": self._wins / n_episodes,
+            "reward_avg": self._reward_sum / n_episodes,
+            "tiles_avg": self._tiles_sum / n_episodes,
+            "all_steps_avg": self._steps_sum / n_episodes,
+            "win_steps_avg": self._win_steps_sum / max(self._wins, 1),
+        }
 
 
 class Episode:
     """Game episode representation"""
+
+    __slots__ = ('won', 'steps', 'final_tiles_count', 'total_reward')
+
     def __init__(self):
         self.won = False
         self.steps = 0
@@ -150,6 +177,41 @@ class LevelsRogueEvaluator(RogueEvaluator):
           The behavior when this is not true is undefined.
     """
 
+    def _reset_sums(self):
+        super()._reset_sums()
+        # running sums per level, for descent and ascent respectively:
+        # number of episodes that reached each level and total steps taken to reach it
+        self._lvls_reached = []
+        self._lvls_steps = []
+        self._alvls_reached = []
+        self._alvls_steps = []
+
+    def _accumulate(self, episode, sign):
+        super()._accumulate(episode, sign)
+        self._accumulate_levels(self._lvls_reached, self._lvls_steps, episode.levels_steps, sign)
+        self._accumulate_levels(self._alvls_reached, self._alvls_steps, episode.ascending_levels_steps, sign)
+
+    @staticmethod
+    def _accumulate_levels(lvls_reached, lvls_steps, ep_steps, sign):
+        """Adds (sign=1) or removes (sign=-1) the steps an episode took to reach each level to the given running sums
+
+        :param list[int] lvls_reached:
+            number of episodes that reached each level
+        :param list[int] lvls_steps:
+            total steps taken to reach each level
+        :param list[int] ep_steps:
+            steps the episode took to reach each level
+        :param int sign:
+            1 if the episode is being added to the collection, -1 if it is being removed
+        """
+        diff = len(ep_steps) - len(lvls_reached)
+        if diff > 0:
+            lvls_reached.extend([0]*diff)
+            lvls_steps.extend([0]*diff)
+        for i, steps in enumerate(ep_steps):
+            lvls_reached[i] += sign
+            lvls_steps[i] += sign * steps
+
     def on_run_begin(self):
         """Records the beginning of a run"""
         self.last_level = 1
@@ -179,26 +241,31 @@ class LevelsRogueEvaluator(RogueEvaluator):
         last_frame = frame_history[-1]
         level = None
         if last_frame.has_statusbar():
-            level = frame_history[-1].statusbar["dungeon_level"]
+            level = last_frame.statusbar["dungeon_level"]
         elif last_frame.is_victory_frame():
             level = 0
 
-        if level is not None and level != self.last_level:
+        last_level = self.last_level
+        if level is not None and level != last_level:
             self.just_changed_level = True
+            episode = self.current_episode
 
             # count the tiles of the frame of the previous level
-            self.current_episode.final_tiles_count += frame_history[-2].get_known_tiles_count()
+            episode.final_tiles_count += frame_history[-2].get_known_tiles_count()
 
             # add as many 'levels_steps' entries as needed, considering even the case of advancing multiple levels
             # in a single frame
-            diff = level - self.last_level
+            diff = level - last_level
             descending = (diff > 0)
             if descending:
-                levels_steps = self.current_episode.levels_steps
+                levels_steps = episode.levels_steps
             else:
                 diff *= -1
-                levels_steps = self.current_episode.ascending_levels_steps
-            levels_steps.extend([self.current_episode.steps]*diff)
+                levels_steps = episode.ascending_levels_steps
+            if diff == 1:
+                levels_steps.append(episode.steps)
+            else:
+                levels_steps.extend(itertools.repeat(episode.steps, diff))
             self.last_level = level
 
         return stop
@@ -239,33 +306,24 @@ class LevelsRogueEvaluator(RogueEvaluator):
         """
         result = super().statistics()
 
-        evaluated_episodes = self.episodes
+        n_episodes = len(self.episodes)
 
-        # compute stats for descending and ascending levels
+        # compute stats for descending and ascending levels from the running sums
         keys = [("lvls_avg", "lvls_steps_avg"), ("alvls_avg", "alvls_steps_avg")]
-        ep_attrs = ['levels_steps', 'ascending_levels_steps']
+        sums = [(self._lvls_reached, self._lvls_steps), (self._alvls_reached, self._alvls_steps)]
 
-        for k, ep_attr in zip(keys, ep_attrs):
+        for k, (lvls_reached, lvls_steps) in zip(keys, sums):
 
-            # accumulate stats for each episode
+            # average stats across all episodes
+            # N.B. a level is reached at least as many times as the next one, so once a level is not reached by any
+            # of the evaluated episodes (i.e. the episodes that reached it were discarded) neither are the next ones
             lvls_avg = []
             lvls_steps_avg = []
-            for e in evaluated_episodes:
-                ep_steps = getattr(e, ep_attr)
-                if len(ep_steps) > 0:
-                    diff = len(ep_steps) - len(lvls_avg)
-                    if diff > 0:
-                        lvls_avg.extend([0]*diff)
-                        lvls_steps_avg.extend([0]*diff)
-                    for i, steps in enumerate(ep_steps):
-                        lvls_avg[i] += 1
-                        lvls_steps_avg[i] += steps
-
-            # average stats across all episodes
-            n_episodes = len(evaluated_episodes)
-            for i, (reached, steps) in enumerate(zip(lvls_avg, lvls_steps_avg)):
-                lvls_steps_avg[i] = steps / reached
-                lvls_avg[i] = reached / n_episodes
+            for reached, steps in zip(lvls_reached, lvls_steps):
+                if reached == 0:
+                    break
+                lvls_steps_avg.append(steps / reached)
+                lvls_avg.append(reached / n_episodes)
 
             k_rate, k_steps = k
             if len(lvls_avg) > 0:
@@ -277,8 +335,12 @@ class LevelsRogueEvaluator(RogueEvaluator):
 
 class LevelsEpisode(Episode):
     """Game episode representation with stats per level"""
+
+    __slots__ = ('levels_steps', 'ascending_levels_steps')
+
     def __init__(self):
         super().__init__()
+        # steps taken to reach each level
         self.levels_steps = []
         self.ascending_levels_steps = []
 
@@ -288,6 +350,18 @@ class AmuletLevelsRogueEvaluator(LevelsRogueEvaluator):
     As a LevelsRogueEvaluator subclass, it will also track levels descent/ascent stats.
     """
 
+    def _reset_sums(self):
+        super()._reset_sums()
+        self._amulet_found_count = 0
+        self._amulet_taken_count = 0
+
+    def _accumulate(self, episode, sign):
+        super()._accumulate(episode, sign)
+        if episode.amulet_found:
+            self._amulet_found_count += sign
+        if episode.amulet_taken:
+            self._amulet_taken_count += sign
+
     def on_run_begin(self):
         """Records the beginning of a run"""
         self.last_level = 1
@@ -311,19 +385,22 @@ class AmuletLevelsRogueEvaluator(LevelsRogueEvaluator):
         """
         stop = super().on_step(frame_history, action, reward, step)
 
+        episode = self.current_episode
+        if episode.amulet_taken:
+            # nothing left to record about the amulet in this run
+            return stop
+
         if len(frame_history) >= 2:
             old_info = frame_history[-2]
             new_info = frame_history[-1]
 
             amulet = old_info.get_list_of_positions_by_tile(',')
             if len(amulet) > 0:
-                self.current_episode.amulet_found = True
-                try:
-                    if old_info.statusbar["dungeon_level"] == new_info.statusbar["dungeon_level"]:
-                        if amulet[0] == new_info.get_player_pos():
-                            self.current_episode.amulet_taken = True
-                except KeyError:
-                    pass
+                episode.amulet_found = True
+                old_level = old_info.statusbar.get("dungeon_level")
+                if old_level is not None and old_level == new_info.statusbar.get("dungeon_level"):
+                    if amulet[0] == new_info.get_player_pos():
+                        episode.amulet_taken = True
 
         return stop
 
@@ -338,20 +415,11 @@ class AmuletLevelsRogueEvaluator(LevelsRogueEvaluator):
         """
         result = super().statistics()
 
-        amulet_found_avg = 0
-        amulet_taken_avg = 0
-
-        evaluated_episodes = self.episodes
-
-        # accumulate stats for each episode
-        for e in evaluated_episodes:
-            if e.amulet_found:
-                amulet_found_avg += 1
-            if e.amulet_taken:
-                amulet_taken_avg += 1
+        amulet_found_avg = self._amulet_found_count
+        amulet_taken_avg = self._amulet_taken_count
 
         # average stats across all episodes
-        n_episodes = len(evaluated_episodes)
+        n_episodes = len(self.episodes)
         if n_episodes > 0:
             amulet_found_avg /= n_episodes
             amulet_taken_avg /= n_episodes
@@ -363,6 +431,9 @@ class AmuletLevelsRogueEvaluator(LevelsRogueEvaluator):
 
 
 class AmuletLevelsEpisode(LevelsEpisode):
+
+    __slots__ = ('amulet_found', 'amulet_taken')
+
     def __init__(self):
         super().__init__()
         self.amulet_found = False
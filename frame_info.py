@@ -21,7 +21,7 @@ class RogueFrameInfo:
     def __init__(self, pixel, map, statusbar, screen):
         """
         :param dict[str, dict[str, list[tuple[int,int]]]] pixel:
-        :param list[list[str]] map:
+        :param np.ndarray | list[list[str]] map:
         :param dict[str, int | str] statusbar:
         :param list[str] screen:
         """
@@ -29,6 +29,14 @@ class RogueFrameInfo:
         self.map = map
         self.statusbar = statusbar
         self.screen = screen
+        # tile -> positions of that tile, regardless of its type
+        self._tiles_positions = {tile: positions
+                                 for tiles_positions in pixel.values()
+                                 for tile, positions in tiles_positions.items()}
+        # computed lazily by the respective methods, frames are not modified after creation
+        self._positions_by_type = {}
+        self._walkable_positions = None
+        self._known_tiles_count = None
 
     def is_victory_frame(self):
         """Returns whether this a victory frame"""
@@ -43,7 +51,9 @@ class RogueFrameInfo:
         return self.get_environment_tile_at(pos)
 
     def get_environment_tile_at(self, pos):
-        """Return the tile at the given position
+        """Return the tile at the given position.
+        If 'pos' is None, is not a pair of coordinates or lies outside the map, ' ' is returned.
+        N.B. negative coordinates are outside the map, they do not wrap around
 
         :param tuple[int,int] pos:
             coordinates of the tile
@@ -52,10 +62,14 @@ class RogueFrameInfo:
         """
         try:
             x, y = pos
-            return self.map[x][y]
-        except (TypeError, ValueError, IndexError):
-            # TypeError and ValueError catch exceptions on "x, y = pos"
+        except (TypeError, ValueError):
+            # e.g. pos is None because the rogue could not be found on the map
             return ' '
+        if 0 <= x < len(self.map):
+            row = self.map[x]
+            if 0 <= y < len(row):
+                return row[y]
+        return ' '
 
     def get_player_pos(self, default=None):
         """Returns the coordinates of the position of the rogue
@@ -66,10 +80,10 @@ class RogueFrameInfo:
         :return:
             rogue coordinates
         """
-        try:
-            return self.pixel["agents"]["@"][0]
-        except (KeyError, IndexError):
-            return default
+        positions = self._tiles_positions.get("@")
+        if positions:
+            return positions[0]
+        return default
 
     def has_statusbar(self):
         """Returns whether the frame contains the status bar"""
@@ -86,12 +100,7 @@ class RogueFrameInfo:
         :return:
             possibly empty list of coordinates
         """
-        for tile_type, tiles_positions in self.pixel.items():
-            try:
-                return tiles_positions[tile]
-            except KeyError:
-                continue
-        return []
+        return self._tiles_positions.get(tile, [])
 
     def get_list_of_positions_by_type(self, tile_type):
         """Returns a list of all positions containing tiles of the given type.
@@ -112,18 +121,30 @@ class RogueFrameInfo:
         :return:
             possibily empty list of coordinates
         """
-        result = []
+        if not self.pixel:
+            # e.g. tombstone or any other screen without a map
+            return []
+
+        try:
+            # a copy is returned so that callers cannot alter the cached positions
+            return list(self._positions_by_type[tile_type])
+        except KeyError:
+            pass
+
+        # positions are deduplicated using the keys of a dict, which also keeps them in order
+        result = {}
         try:
             tiles_positions = self.pixel[tile_type]
             for tile, positions in tiles_positions.items():
-                # TODO: is using a set useful here?
+                # TODO: is deduplicating useful here?
                 # it is useful only if two tiles of the same type (e.g. environment tiles like doors, floors and corridors)
                 # could be on the same position AND we don't want to insert that same position twice in the list
                 # otherwise it's a waste of time
-                result = list(set().union(result, positions))
+                result.update(dict.fromkeys(positions))
         except KeyError:
             pass
-        return result
+        self._positions_by_type[tile_type] = tuple(result)
+        return list(result)
 
     def get_list_of_walkable_positions(self):
         """Return the list of positions that can be walked on
@@ -132,13 +153,26 @@ class RogueFrameInfo:
         :return:
             possibily empty list of coordinates
         """
+        if not self.pixel:
+            # e.g. tombstone or any other screen without a map
+            return []
+
+        if self._walkable_positions is not None:
+            # a copy is returned so that callers cannot alter the cached positions
+            return list(self._walkable_positions)
+
         corridors = self.get_list_of_positions_by_tile("#")
         doors = self.get_list_of_positions_by_tile("+")
         floors = self.get_list_of_positions_by_tile(".")
         items = self.get_list_of_positions_by_type("items")
-        # TODO: is using a set useful here?
-        # same reasons as above
-        return list(set().union(corridors, doors, floors, items))
+        # corridors, doors and floors never share a position since each map cell holds a single environment tile,
+        # so they can just be concatenated; items on the other hand may lie on top of an already known environment
+        # tile, in which case the map tells us their position has already been listed
+        result = corridors + doors + floors
+        walkable_environment = ('#', '+', '.')
+        result.extend(pos for pos in items if self.map[pos[0]][pos[1]] not in walkable_environment)
+        self._walkable_positions = tuple(result)
+        return result
 
     def get_tile_count(self, tile):
         """Returns the number of occurrences of the given tile on the screen
@@ -151,8 +185,12 @@ class RogueFrameInfo:
         :return:
             number of occurrences of the given tile
         """
-        return len(self.get_list_of_positions_by_tile(tile))
+        return len(self._tiles_positions.get(tile, ()))
 
     def get_known_tiles_count(self):
         """Returns the number of all non-empty tiles on the screen"""
-        return sum(len(self.get_list_of_positions_by_type(tile_type)) for tile_type in self.pixel)
+        if self._known_tiles_count is None:
+            # N.B. the parser never lists the same position twice for tiles of the same type,
+            # so there is no need to deduplicate positions as get_list_of_positions_by_type() does
+            self._known_tiles_count = sum(map(len, self._tiles_positions.values()))
+        return self._known_tiles_count
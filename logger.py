@@ -15,8 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import atexit
 import time
-from datetime import datetime
 
 
 class Log:
@@ -48,6 +48,11 @@ class Log:
 class Logger:
     """Implements a logger that supports conditions, timers and logging every X times"""
 
+    # size in bytes of the buffer of the log file
+    file_buffer_size = 64 * 1024
+    # maximum number of seconds buffered logs can wait before being written to the log file
+    file_flush_interval = 5
+
     def __init__(self, log_depth=0, log_targets=["terminal"], filepath="logfile.log", ui=None):
         """Constructor for Logger
 
@@ -75,12 +80,30 @@ class Logger:
         self.timers = {}
         self.every = {}
         self.means = {}
+        self.log_file = None
         if "file" in log_targets:
-            self.log_file = open(filepath, "a+")
-        current_time = datetime.now().isoformat()
-        text = "\n\n[ Started session at {} ]\n\n ".format(current_time)
+            # logs are written in blocks rather than line by line, see .flush() and .close()
+            # the file is opened in binary mode and logs are encoded once, bypassing the text layer
+            self.log_file = open(filepath, "ab", buffering=self.file_buffer_size)
+            self._last_flush = time.monotonic()
+            # do not lose the buffered logs when the program exits, e.g. because of an uncaught exception
+            atexit.register(self.flush)
+        # local time, truncated to the second, of the last timestamp and its formatted string
+        self._timestamp_second = None
+        self._timestamp_prefix = None
+        text = "\n\n[ Started session at {} ]\n\n ".format(self._timestamp())
         self._print(text)
 
+    def is_enabled(self, depth):
+        """Returns whether logs with the given depth are printed.
+        Useful to avoid building expensive log texts that would be discarded anyway.
+
+        :param int depth:
+            depth of the log
+        :rtype: bool
+        """
+        return depth <= self.depth
+
     def log(self, logs, condition=True):
         """Print the given log on the medium defined in the settings if the depth is right. An addition 'condition'
         gets evaluated before execution. It's possible to print the log text every 'log.every' cycle.
@@ -92,15 +115,13 @@ class Logger:
         """
         if condition:
             for log in logs:
-                if log.depth <= self.depth:
+                if self.is_enabled(log.depth):
                     if log.every > 1:
-                        if log.name not in self.every:
-                            self.every[log.name] = 1
-                        else:
-                            self.every[log.name] += 1
-                            if self.every[log.name] >= log.every:
-                                self.every[log.name] = 0
-                                self._print(log.text)
+                        count = self.every.get(log.name, 0) + 1
+                        if count >= log.every:
+                            count = 0
+                            self._print(log.text)
+                        self.every[log.name] = count
                     else:
                         self._print(log.text)
 
@@ -116,12 +137,12 @@ class Logger:
         """
         if condition:
             for log in logs:
-                if log.depth <= self.depth:
+                if self.is_enabled(log.depth):
                     if log.mean > 1 and log.name not in self.means:
                         # very first time of a mean request
                         self.means[log.name] = [0, 0]
                     # init the timer
-                    self.timers[log.name] = time.time()
+                    self.timers[log.name] = time.monotonic()
 
     def stop_log_timer(self, logs, condition=True):
         """Stop a timer count on the given log if the depth is right. If log.mean is more than one a mean is
@@ -135,21 +156,34 @@ class Logger:
         """
         if condition:
             for log in logs:
-                if log.depth <= self.depth and log.name in self.timers:
-                    elapsedTime = time.time() - self.timers[log.name]
-                    self.timers.pop(log.name)  # reset the timer
-                    if log.mean > 1 and log.name in self.means:
+                if self.is_enabled(log.depth) and log.name in self.timers:
+                    # times are measured with a clock that cannot go backwards
+                    elapsed = time.monotonic() - self.timers.pop(log.name)  # also resets the timer
+                    timer_mean = self.means.get(log.name) if log.mean > 1 else None
+                    if timer_mean is not None:
                         # update the timer mean
-                        self.means[log.name][0] += elapsedTime
-                        self.means[log.name][1] += 1
-                        if self.means[log.name][1] >= log.mean:
-                            mean = self.means[log.name][0] / log.mean
+                        timer_mean[0] += elapsed
+                        timer_mean[1] += 1
+                        if timer_mean[1] >= log.mean:
+                            mean_ms = int(timer_mean[0] * 1000 / log.mean)
                             self.means.pop(log.name)
-                            self._print('{} cycles of [{}] took a mean of {} ms to execute'.format(
-                                log.mean, log.text, int(mean * 1000)))
+                            self._print('%s cycles of [%s] took a mean of %d ms to execute' % (
+                                log.mean, log.text, mean_ms))
                     else:
-                        self._print('[{}] : {} ms'.format(
-                            log.text, int(elapsedTime * 1000)))
+                        self._print('[%s] : %d ms' % (log.text, int(elapsed * 1000)))
+
+    def _timestamp(self):
+        """Returns the current local time in ISO 8601 format, with microseconds.
+        The date and time up to the seconds are only formatted once per second.
+
+        :rtype: str
+        """
+        now = time.time()
+        second = int(now)
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        return "%s.%06d" % (self._timestamp_prefix, int((now - second) * 1000000))
 
     def _print(self, string):
         """Logs a string on the media provided during init
@@ -157,12 +191,29 @@ class Logger:
         :param str string:
             string to print
         """
-        current_time = datetime.now().isoformat()
-        formatted_str = "[{}] {}".format(current_time, string)
+        formatted_str = None  # timestamped string, only built if a target needs it
         for target in self.targets:
-            if target == "terminal":
-                print(formatted_str)
-            elif target == "file":
-                print(formatted_str, file=self.log_file)
+            if target == "terminal" or target == "file":
+                if formatted_str is None:
+                    formatted_str = "[%s] %s" % (self._timestamp(), string)
+                if target == "terminal":
+                    print(formatted_str)
+                else:
+                    self.log_file.write((formatted_str + "\n").encode("utf-8"))
+                    now = time.monotonic()
+                    if now - self._last_flush >= self.file_flush_interval:
+                        self.log_file.flush()
+                        self._last_flush = now
             elif target == "ui" and self.ui is not None:
                 self.ui.draw_log(string)
+
+    def flush(self):
+        """Writes any buffered log to the log file"""
+        if self.log_file is not None:
+            self.log_file.flush()
+
+    def close(self):
+        """Flushes and closes the log file, if any. The logger should not be used anymore afterwards"""
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
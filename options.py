@@ -70,16 +70,24 @@ class RogueOptions:
         self._seed = seed if seed is not None else self._rng.getrandbits(32)
 
     def generate_args(self):
-        args= ['--disable-monsters' if not self.use_monsters else '',
-               '--disable-secrets' if not self.enable_secrets else '',
-               '--disable-darkrooms' if self.disable_dark_rooms else '',
-               '--disable-mazes' if self.disable_mazes else '',
-               '--more-mazes' if self.more_mazes else '',
-               ('--seed=%s' % self._seed) if self._seed is not None else '',
-               ('--amulet-level=%s' % self.amulet_level),
-               ('--start-level=%s' % self.start_level),
-               ('--hungertime=%s' % self.hungertime),
-               ('--max-traps=%s' % self.max_traps)]
+        # only the flags that are actually set are passed, rather than empty strings in place of the others
+        args = []
+        if not self.use_monsters:
+            args.append('--disable-monsters')
+        if not self.enable_secrets:
+            args.append('--disable-secrets')
+        if self.disable_dark_rooms:
+            args.append('--disable-darkrooms')
+        if self.disable_mazes:
+            args.append('--disable-mazes')
+        if self.more_mazes:
+            args.append('--more-mazes')
+        if self._seed is not None:
+            args.append('--seed=%s' % self._seed)
+        args += ['--amulet-level=%s' % self.amulet_level,
+                 '--start-level=%s' % self.start_level,
+                 '--hungertime=%s' % self.hungertime,
+                 '--max-traps=%s' % self.max_traps]
         if not self.fixed_seed:
             self._seed = self._rng.getrandbits(32)
         return args
@@ -17,8 +17,6 @@
 
 import re
 import numpy as np
-import itertools
-import copy
 
 from .frame_info import RogueFrameInfo
 
@@ -48,14 +46,31 @@ class RogueParser:
 
     # tile type -> set of tiles of that type
     tiles_types_dict = {
-        "environment": set(tile for tile in '#+.%-|'),
-        "items":       set(tile for tile in '^*!?$:)],=/'),
-        "monsters":    set(tile for tile in 'KEBSHIROZLCQANYFTWPXUMVGJD'),
-        "agents":      set(tile for tile in '@'),
+        "environment": frozenset('#+.%-|'),
+        "items":       frozenset('^*!?$:)],=/'),
+        "monsters":    frozenset('KEBSHIROZLCQANYFTWPXUMVGJD'),
+        "agents":      frozenset('@'),
     }
 
+    # tile types in the order in which they are looked for when parsing a screen
+    tiles_types = ("environment", "items", "agents", "monsters")
+
     def __init__(self):
         self.last_info = None
+        self.tiles_types_lut = self._build_tiles_types_lut()
+
+    def _build_tiles_types_lut(self):
+        """Returns a lookup table mapping each ascii code to 1 + the index in self.tiles_types of the type of the
+        corresponding tile, or to 0 if the character is not a known tile. Non ascii codes should be mapped to 127.
+
+        :rtype: np.ndarray
+        """
+        lut = np.zeros(128, dtype=np.uint8)
+        # types looked for first take precedence
+        for index in reversed(range(len(self.tiles_types))):
+            for tile in self.tiles_types_dict[self.tiles_types[index]]:
+                lut[ord(tile)] = index + 1
+        return lut
 
     def reset(self):
         """reset internal state, call this before parsing a non-consecutive screen"""
@@ -78,26 +93,94 @@ class RogueParser:
 
     @staticmethod
     def empty_environment_map():
-        env = []
-        for x in range(22):
-            row = []
-            for y in range(80):
-                row.append(" ")
-            env.append(row)
-        return env
+        """Returns a 22x80 array of blank tiles, each of which is a single character string"""
+        return np.full((22, 80), ' ', dtype='<U1')
+
+    # status bar fields parsed as integers
+    statusbar_numeric_fields = frozenset(("dungeon_level", "gold", "current_hp", "max_hp", "current_strength",
+                                          "max_strength", "armor", "exp_level", "tot_exp", "command_count"))
+    # labels of the status bar fields, as tokens of a status bar in the usual rogue format
+    statusbar_labels = ["Level:", "Gold:", "Hp:", "Str:", "Arm:", "Exp:"]
+    # possible values of the status field of the status bar, besides ''
+    statusbar_status_values = frozenset(("Hungry", "Weak", "Faint"))
+
+    @classmethod
+    def _scan_statusbar(cls, statusbar):
+        """Parses a status bar in the usual rogue format by splitting it into tokens, which is faster than
+        matching .parse_statusbar_re.
+        Returns None if the status bar is not in the exact expected format, in which case the regexp must be used.
+
+        :param str statusbar:
+            last line of the screen
+        :rtype: dict[str, int | str] | None
+        """
+        # expected: Level: <n> Gold: <n> Hp: <n>(<n>) Str: <n>(<n>) Arm: <n> Exp: <n>/<n> [status] [Cmd: [<n>]]
+        tokens = statusbar.split()
+        if len(tokens) < 12 or tokens[0:11:2] != cls.statusbar_labels:
+            return None
+        hp, strength = tokens[5], tokens[7]
+        if hp[-1] != ")" or strength[-1] != ")":
+            return None
+        current_hp, _, max_hp = hp[:-1].partition("(")
+        current_strength, _, max_strength = strength[:-1].partition("(")
+        exp_level, _, tot_exp = tokens[11].partition("/")
+        numbers = [tokens[1], tokens[3], current_hp, max_hp, current_strength, max_strength, tokens[9],
+                   exp_level, tot_exp]
+        # N.B. \d matches exactly the non empty strings of unicode decimal characters
+        if not (all(numbers) and "".join(numbers).isdecimal()):
+            return None
+
+        status = ""
+        command_count = None
+        n_tokens = len(tokens)
+        if n_tokens > 12:
+            i = 12
+            if tokens[i] in cls.statusbar_status_values:
+                status = tokens[i]
+                i += 1
+            if i < n_tokens:
+                if tokens[i] != "Cmd:" or n_tokens - i > 2:
+                    return None
+                command_count = ""
+                if n_tokens - i == 2:
+                    if not tokens[i + 1].isdecimal():
+                        return None
+                    command_count = int(tokens[i + 1])
+
+        return {
+            "dungeon_level": int(tokens[1]),
+            "gold": int(tokens[3]),
+            "current_hp": int(current_hp),
+            "max_hp": int(max_hp),
+            "current_strength": int(current_strength),
+            "max_strength": int(max_strength),
+            "armor": int(tokens[9]),
+            "exp_level": int(exp_level),
+            "tot_exp": int(tot_exp),
+            "status": status,
+            "command_count": command_count,
+            "is_empty": False,
+        }
 
     def build_statusbar(self, screen):
-        bar = {}
         # parse status bar, status bar is the last line
         statusbar = screen[-1]
+        if not statusbar.startswith("Level:"):
+            # the regexp cannot match either, e.g. this is the status bar of an empty screen
+            return {"is_empty": True}
+        bar = self._scan_statusbar(statusbar)
+        if bar is not None:
+            return bar
+
+        # unusual status bar, fall back to the regexp
+        bar = {}
         parsed_statusbar = self.parse_statusbar_re.match(statusbar)
         if (parsed_statusbar != None):  # parsed_statusbar of an empty screen is None
             statusbar_infos = parsed_statusbar.groupdict()
-            for info in statusbar_infos:
-                try:
-                    bar[info] = int(statusbar_infos[info])
-                except:
-                    bar[info] = statusbar_infos[info]
+            # numeric fields are left as they are only when empty ('') or missing (None)
+            numeric_fields = self.statusbar_numeric_fields
+            for info, value in statusbar_infos.items():
+                bar[info] = int(value) if value and info in numeric_fields else value
             bar["is_empty"] = False
         else:
             bar["is_empty"] = True
@@ -133,6 +216,13 @@ class RogueParser:
         if new_level != old_level:
             self.environment_map = self.empty_environment_map()  # reset the environment state
             self.environment_dict = self._build_type_dict("environment")
+        elif self.last_info and self.last_info.pixel and self.last_info.screen[1:23] == screen[1:23]:
+            # the map is exactly the same as in the last parsed frame (e.g. only the status bar changed or the
+            # command had no visible effect): so are all tiles positions and there is no new environment tile
+            self.pixel = {tile_type: {tile: positions[:] for tile, positions in tiles_positions.items()}
+                          for tile_type, tiles_positions in self.last_info.pixel.items()}
+            self.last_info = RogueFrameInfo(pixel=self.pixel, map=self.environment_map.copy(), statusbar=new_statusbar, screen=screen)
+            return self.last_info
 
         # optimal info initialisation
         self.pixel = {}
@@ -141,24 +231,32 @@ class RogueParser:
         self.pixel["items"] = self._build_type_dict("items")
 
         # populate the info dictionary
-        for x, j in itertools.product(range(1, 23), range(80)):
-            pixel = screen[x][j]
-            i = x - 1  # The internal map has a different size and it is 22x80, on the other hand the screen is 24x80. The first and the last screen line contains useless metadata
-            if pixel in self.tiles_types_dict["environment"]:  # immobile environment
-                # once initialised, there is no need to re-initialise it again because the environment is immobile
-                if str(self.environment_map[i][j]) == ' ':
-                    self.environment_map[i][j] = pixel
-                    self.environment_dict[pixel].append((i, j))
-            elif pixel in self.tiles_types_dict["items"]:  # items
-                self.pixel["items"][pixel].append((i, j))
-            elif pixel in self.tiles_types_dict["agents"]:  # agents
-                self.pixel["agents"][pixel].append((i, j))
-            elif pixel in self.tiles_types_dict["monsters"]:  # monsters
-                self.pixel["monsters"][pixel].append((i, j))
+        # the internal map has a different size and it is 22x80, on the other hand the screen is 24x80:
+        # the first and the last screen line contain useless metadata
+        tiles = ''.join(screen[1:23])
+        codes = np.frombuffer(tiles.encode('utf-32-le'), dtype='<u4')
+        tiles_types = self.tiles_types_lut[np.minimum(codes, 127)]
+
+        # immobile environment
+        # once initialised, there is no need to re-initialise it again because the environment is immobile
+        environment_map = self.environment_map.reshape(-1)  # flat view
+        new_environment = np.flatnonzero((tiles_types == 1) & (environment_map == ' '))
+        environment_map[new_environment] = codes.view('<U1')[new_environment]
+        environment_dict = self.environment_dict
+        for k in new_environment.tolist():
+            environment_dict[tiles[k]].append(divmod(k, 80))
+
+        # items, agents and monsters
+        # the actual work is only done for the few such tiles, blanks are skipped by numpy
+        other_indices = np.flatnonzero(tiles_types > 1)
+        type_dicts = [None, None] + [self.pixel[tile_type] for tile_type in self.tiles_types[1:]]
+        for k, type_index in zip(other_indices.tolist(), tiles_types[other_indices].tolist()):
+            type_dicts[type_index][tiles[k]].append(divmod(k, 80))
 
         # copies must be returned in order to be able to keep a history and compare different frames
-        self.pixel["environment"] = copy.deepcopy(self.environment_dict)
-        self.last_info = RogueFrameInfo(pixel=self.pixel, map=copy.deepcopy(self.environment_map), statusbar=new_statusbar, screen=screen)
+        # positions are immutable tuples, so copying the lists is enough
+        self.pixel["environment"] = {tile: positions[:] for tile, positions in self.environment_dict.items()}
+        self.last_info = RogueFrameInfo(pixel=self.pixel, map=self.environment_map.copy(), statusbar=new_statusbar, screen=screen)
         return self.last_info
 
     def get_cmd_count(self, screen):
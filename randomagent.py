@@ -38,9 +38,15 @@ import random
 class RandomAgent(BaseAgent):
     """Implements an agent that performs random actions"""
 
+    def __init__(self, options=AgentOptions()):
+        super().__init__(options)
+        # the available actions never change, fetch them once
+        self.actions = tuple(self.rb.get_actions())
+        # N.B. this is bound to the global random generator, so random.seed() still applies
+        self._choice = random.choice
+
     def act(self):
-        actions = self.rb.get_actions()
-        action = random.choice(actions)
+        action = self._choice(self.actions)
         _, _, won, lost = self.rb.send_command(action)
         return won or lost
 
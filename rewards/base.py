@@ -27,6 +27,8 @@ class RewardGenerator(ABC):
     N.B. Instance attribute .goal_achieved is used by rogueinabox to determine if an episode is won
     """
 
+    __slots__ = ('default_reward', 'goal_achieved', '_last_frames', '_last_reward')
+
     def __init__(self):
         self.set_default_reward()
         self.reset()
@@ -39,6 +41,9 @@ class RewardGenerator(ABC):
 
     def reset(self):
         self.goal_achieved = False
+        # last pair of frames a reward was computed on and the resulting reward, see .compute_reward()
+        self._last_frames = None
+        self._last_reward = None
 
     def compute_reward(self, frame_history):
         """return a reward computed from the given frame history
@@ -49,7 +54,16 @@ class RewardGenerator(ABC):
             reward
         """
         if self.is_frame_history_sufficient(frame_history):
-            return self.normalize_value(self.get_value(frame_history))
+            frames = (frame_history[-2], frame_history[-1])
+            last_frames = self._last_frames
+            if last_frames is not None and last_frames[0] is frames[0] and last_frames[1] is frames[1]:
+                # the reward for these frames has already been computed, doing it again could also alter the state
+                # of the generator (e.g. .goal_achieved)
+                return self._last_reward
+            reward = self.normalize_value(self.get_value(frame_history))
+            self._last_frames = frames
+            self._last_reward = reward
+            return reward
         return self.default_reward
 
     def is_frame_history_sufficient(self, frame_history):
@@ -91,38 +105,49 @@ class RewardGenerator(ABC):
 
     @staticmethod
     def remap(x, oMax, nMax):
-        # range check
-        oMin = -oMax
-        nMin = -nMax
+        """linearly maps x from the range [-oMax, oMax] to [-nMax, nMax].
+        If oMax and nMax have different signs, the mapping is reversed.
+        """
+        return x * nMax / oMax
 
-        # check reversed input range
-        reverseInput = False
-        oldMin = min(oMin, oMax)
-        oldMax = max(oMin, oMax)
-        if not oldMin == oMin:
-            reverseInput = True
 
-        # check reversed output range
-        reverseOutput = False
-        newMin = min(nMin, nMax)
-        newMax = max(nMin, nMax)
-        if not newMin == nMin:
-            reverseOutput = True
+class Discovery_RewardGenerator(RewardGenerator):
+    """Generate a reward for the last action, checking in order:
+        .descent_reward for descending the stairs
+        .door_reward for discovering new doors
+        .corridor_reward for discovering new corridor tiles
+        .standing_reward for standing still
+    The first matching event determines the reward, a value of 0 disables the corresponding check.
+    Subclasses only need to set the class attributes.
+    """
 
-        portion = (x - oldMin) * (newMax - newMin) / (oldMax - oldMin)
-        if reverseInput:
-            portion = (oldMax - x) * (newMax - newMin) / (oldMax - oldMin)
+    __slots__ = ()
 
-        result = portion + newMin
-        if reverseOutput:
-            result = newMax - portion
+    descent_reward = 10
+    door_reward = 0
+    corridor_reward = 0
+    standing_reward = 0
 
-        return result
+    def get_value(self, frame_history):
+        old_info = frame_history[-2]
+        new_info = frame_history[-1]
+        if self.descent_reward and new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
+            self.goal_achieved = True
+            return self.descent_reward
+        elif self.door_reward and new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
+            return self.door_reward
+        elif self.corridor_reward and new_info.get_tile_count("#") > old_info.get_tile_count("#"):  # passages
+            return self.corridor_reward
+        elif self.standing_reward and self.player_standing_still(old_info, new_info):  # standing reward
+            return self.standing_reward
+        return 0
 
 
 class Dummy_RewardGenerator(RewardGenerator):
     """Dummy generator that always returns 0"""
 
+    __slots__ = ()
+
     def compute_reward(self, frame_history):
         return 0
 
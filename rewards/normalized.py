@@ -15,33 +15,27 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from .base import RewardGenerator
+from .base import Discovery_RewardGenerator
 
 
-class Normalised_RewardGenerator(RewardGenerator):
+class Normalised_RewardGenerator(Discovery_RewardGenerator):
     """Generate a reward for the last action, mapped from [-500,500] to [-1,1]:
         +250 for descending the stairs
         +10 for each new door discovered
         -1 for standing still
     """
 
+    __slots__ = ()
+
+    descent_reward = 250
+    door_reward = 10
+    standing_reward = -1
+
     def normalize_value(self, reward):
         return self.remap(reward, 500, 1)  # from [-500,500] to [-1,1]
 
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 250
-        elif new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
-            return 10
-        elif self.player_standing_still(old_info, new_info):  # standing reward
-            return -1
-        return 0
-
 
-class Normalised_2_RewardGenerator(RewardGenerator):
+class Normalised_2_RewardGenerator(Discovery_RewardGenerator):
     """Generate a reward for the last action, mapped from [-500,500] to [-1,1]:
         +250 for descending the stairs
         +10 for each new door discovered
@@ -49,25 +43,18 @@ class Normalised_2_RewardGenerator(RewardGenerator):
         -1 for standing still
     """
 
+    __slots__ = ()
+
+    descent_reward = 250
+    door_reward = 10
+    corridor_reward = 1
+    standing_reward = -1
+
     def normalize_value(self, reward):
         return self.remap(reward, 500, 1)  # from [-500,500] to [-1,1]
 
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 250
-        elif new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
-            return 10
-        elif new_info.get_tile_count("#") > old_info.get_tile_count("#"):  # passages
-            return 1
-        elif self.player_standing_still(old_info, new_info):  # standing reward
-            return -1
-        return 0
-
-
-class Normalised_3_RewardGenerator(RewardGenerator):
+
+class Normalised_3_RewardGenerator(Discovery_RewardGenerator):
     """Generate a reward for the last action, mapped from [-500,500] to [-1,1]:
         +250 for descending the stairs
         +10 for each new door discovered
@@ -75,18 +62,12 @@ class Normalised_3_RewardGenerator(RewardGenerator):
         -5 for standing still
     """
 
+    __slots__ = ()
+
+    descent_reward = 250
+    door_reward = 10
+    corridor_reward = 5
+    standing_reward = -5
+
     def normalize_value(self, reward):
         return self.remap(reward, 2500, 1)  # from [-2500,2500] to [-1,1]
-
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 250
-        elif new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
-            return 10
-        elif new_info.get_tile_count("#") > old_info.get_tile_count("#"):  # passages
-            return 5
-        elif self.player_standing_still(old_info, new_info):  # standing reward
-            return -5
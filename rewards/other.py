@@ -16,7 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
-from .base import RewardGenerator
+from .base import RewardGenerator, Discovery_RewardGenerator
 
 
 class E_D_W_RewardGenerator(RewardGenerator):
@@ -26,6 +26,8 @@ class E_D_W_RewardGenerator(RewardGenerator):
         -0.1 living reward
     """
 
+    __slots__ = ()
+
     def set_default_reward(self):
         self.default_reward = -1
 
@@ -49,6 +51,8 @@ class E_D_Ps_W_RewardGenerator(E_D_W_RewardGenerator):
         -0.1 living reward
     """
 
+    __slots__ = ()
+
     def get_value(self, frame_history):
         old_info = frame_history[-2]
         new_info = frame_history[-1]
@@ -57,7 +61,7 @@ class E_D_Ps_W_RewardGenerator(E_D_W_RewardGenerator):
         return super().get_value(frame_history)
 
 
-class Clipped_RewardGenerator(RewardGenerator):
+class Clipped_RewardGenerator(Discovery_RewardGenerator):
     """Generate a reward for the last action:
         +1 for descending the stairs
         +1 for each new door discovered
@@ -65,19 +69,12 @@ class Clipped_RewardGenerator(RewardGenerator):
         -0.05 for standing still
     """
 
+    __slots__ = ()
+
+    descent_reward = 10000
+    door_reward = 100
+    corridor_reward = 1
+    standing_reward = -0.05
+
     def normalize_value(self, reward):
         return np.clip(reward, -1, 1)
-
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 10000
-        elif new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
-            return 100
-        elif new_info.get_tile_count("#") > old_info.get_tile_count("#"):  # passages
-            return 1
-        elif self.player_standing_still(old_info, new_info):  # standing reward
-            return -0.05
-        return 0
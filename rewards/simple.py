@@ -15,18 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from .base import RewardGenerator
+from .base import RewardGenerator, Discovery_RewardGenerator
 
 
-class StairsOnly_RewardGenerator(RewardGenerator):
+class StairsOnly_RewardGenerator(Discovery_RewardGenerator):
+    __slots__ = ()
 
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 10
-        return 0
+    descent_reward = 10
 
 
 class StairsOnly_NthLevel_RewardGenerator(RewardGenerator):
@@ -34,6 +29,8 @@ class StairsOnly_NthLevel_RewardGenerator(RewardGenerator):
     If 'objective_level' is reached, declares the game won.
     """
 
+    __slots__ = ('last_level',)
+
     objective_level = 10
 
     def reset(self):
@@ -55,6 +52,8 @@ class AmuletVictory_RewardGenerator(RewardGenerator):
     By default, the generated rewards have value 10.
     """
 
+    __slots__ = ('amulet_taken',)
+
     reward_value = 10
 
     def reset(self):
@@ -73,15 +72,14 @@ class AmuletVictory_RewardGenerator(RewardGenerator):
         new_info = frame_history[-1]
 
         if not self.amulet_taken:
-            amulet = old_info.get_list_of_positions_by_tile(',')
-            try:
-                if old_info.statusbar["dungeon_level"] == new_info.statusbar["dungeon_level"]:
-                    if amulet[0] == new_info.get_player_pos():
-                        self.amulet_taken = True
-                        return self.reward_value
+            if old_info.statusbar["dungeon_level"] == new_info.statusbar["dungeon_level"]:
+                amulet = old_info.get_list_of_positions_by_tile(',')
+                if not amulet:
+                    # amulet not visible
                     return 0
-            except (IndexError, KeyError):
-                # amulet not visible
+                if amulet[0] == new_info.get_player_pos():
+                    self.amulet_taken = True
+                    return self.reward_value
                 return 0
 
         if new_info.is_victory_frame():
@@ -15,64 +15,47 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from .base import RewardGenerator
+from .base import Discovery_RewardGenerator
 
 
-class StairSeeker_RewardGenerator(RewardGenerator):
+class StairSeeker_RewardGenerator(Discovery_RewardGenerator):
     """Generate a reward for the last action:
         +10 for descending the stairs
         +1 for discovering new doors
         -0.01 for standing still
     """
 
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 10
-        elif new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
-            return 1
-        elif self.player_standing_still(old_info, new_info):  # standing reward
-            return -0.01
-        return 0
+    __slots__ = ()
+
+    descent_reward = 10
+    door_reward = 1
+    standing_reward = -0.01
 
 
-class StairSeeker_13_RewardGenerator(RewardGenerator):
+class StairSeeker_13_RewardGenerator(Discovery_RewardGenerator):
     """Generate a reward for the last action:
         +10000 for descending the stairs
         +1 for discovering new doors
         +1 for each new corridor tile discovered
     """
 
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 10000
-        elif new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
-            return 1
-        elif new_info.get_tile_count("#") > old_info.get_tile_count("#"):  # passages
-            return 1
-        return 0
+    __slots__ = ()
 
+    descent_reward = 10000
+    door_reward = 1
+    corridor_reward = 1
 
-class StairSeeker_15_RewardGenerator(RewardGenerator):
+
+class StairSeeker_15_RewardGenerator(Discovery_RewardGenerator):
     """Generate a reward for the last action:
         +10000 for descending the stairs
         +100 for discovering new doors
     """
 
-    def get_value(self, frame_history):
-        old_info = frame_history[-2]
-        new_info = frame_history[-1]
-        if new_info.statusbar["dungeon_level"] > old_info.statusbar["dungeon_level"]:
-            self.goal_achieved = True
-            return 10000
-        elif new_info.get_tile_count("+") > old_info.get_tile_count("+"):  # doors
-            return 100
-        return 0
+    __slots__ = ()
+
+    descent_reward = 10000
+    door_reward = 100
 
 
 class ImprovedStairSeeker_RewardGenerator(StairSeeker_RewardGenerator):
@@ -83,6 +66,8 @@ class ImprovedStairSeeker_RewardGenerator(StairSeeker_RewardGenerator):
         -0.01 for standing still
     """
 
+    __slots__ = ()
+
     def get_value(self, frame_history):
         old_info = frame_history[-2]
         new_info = frame_history[-1]
@@ -100,6 +85,8 @@ class ImprovedStairSeeker2_RewardGenerator(ImprovedStairSeeker_RewardGenerator):
         -0.01 for standing still
     """
 
+    __slots__ = ()
+
     def get_value(self, frame_history):
         old_info = frame_history[-2]
         new_info = frame_history[-1]
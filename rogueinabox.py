@@ -19,6 +19,7 @@ import time
 import os
 import fcntl
 import pty
+import select
 import signal
 import pyte
 import shutil
@@ -192,6 +193,8 @@ class RogueBox:
         # start game process
         rogue_args = self.rogue_options.generate_args() if self._default_exe else []
         self.terminal, self.pid, self.pipe = open_terminal(command=self.rogue_path, args=rogue_args)
+        self._pipe_poll = select.poll()
+        self._pipe_poll.register(self.pipe, select.POLLIN)
 
         if not self.is_running():
             print("Could not find the executable in %s." % self.rogue_path)
@@ -253,6 +256,14 @@ class RogueBox:
             self.terminal.feed(update)
             self.screen = self.terminal.read()
 
+    def _wait_for_output(self, timeout):
+        """block until rogue writes on the terminal or 'timeout' seconds have passed (N.B. does not refresh the screen)
+
+        :param float timeout:
+            maximum number of seconds to wait for
+        """
+        self._pipe_poll.poll(max(timeout, 0) * 1000)
+
     def get_empty_screen(self):
         screen = list()
         for row in range(24):
@@ -397,9 +408,9 @@ class RogueBox:
         expected_cmd_count = old_cmd_count + cmd_sent
         new_cmd_count = old_cmd_count
         t0 = time.perf_counter()
-        # busy wait until the cmd count is increased
+        # wait until the cmd count is increased, sleeping on the pipe instead of polling it
         while new_cmd_count < expected_cmd_count:
-            time.sleep(self.busy_wait_seconds)
+            self._wait_for_output(self.max_busy_wait_seconds - (time.perf_counter() - t0))
             self._update_screen()
             dismiss_cmds = self._dismiss_all_messages()
             if self.game_over():
@@ -434,11 +445,13 @@ class RogueBox:
             if command == '>':
                 command = '<'
 
-        self.pipe.write(command.encode())
+        data = command.encode()
         # rogue may not properly print all tiles after elaborating a command
         # so, based on the init options, we send a refresh command
         if self.refresh_after_commands:
-            self.pipe.write(self.refresh_command)
+            data += self.refresh_command
+        # N.B. the pipe is unbuffered, so this is a single os.write() that does not hold the GIL while blocking
+        self.pipe.write(data)
 
         try:
             entered_loop = False
@@ -28,6 +28,10 @@ class UI(object):
         """After the given time in ms is passed, call the callback function, return the timer"""
         pass
 
+    def on_timer_repeat(self, timer, callback):
+        """Call the callback function every time the given time in ms is passed, return the timer"""
+        pass
+
     def cancel_timer(self, timer):
         """Cancel a previously set timer"""
         pass
@@ -80,6 +80,12 @@ class UICurse(UI):
         self.sleep_time = timer / 1000
         return True
 
+    def on_timer_repeat(self, timer, callback):
+        """Call the callback function every time the given time in ms is passed, return the timer.
+        This is the same as .on_timer_end(), since the curses main loop already calls the timer callback repeatedly
+        """
+        return self.on_timer_end(timer, callback)
+
     def cancel_timer(self, timer):
         """TODO docs"""
         self.timer_callback = None
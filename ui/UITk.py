@@ -19,6 +19,14 @@ from tkinter import Tk, StringVar, Label
 from .UI import UI
 
 
+class RepeatingTimer(object):
+    """handle of a timer set with UITk.on_timer_repeat()"""
+
+    def __init__(self):
+        self.after_id = None
+        self.cancelled = False
+
+
 class UITk(UI):
     """TODO doc for UITk"""
 
@@ -40,8 +48,25 @@ class UITk(UI):
         """TODO docs"""
         return self.window.after(timer, callback)
 
+    def on_timer_repeat(self, timer, callback):
+        """Call the callback function every 'timer' ms, return the timer.
+        The next call is scheduled once the callback returns, unless the timer was cancelled meanwhile.
+        """
+        handle = RepeatingTimer()
+
+        def tick():
+            callback()
+            if not handle.cancelled:
+                handle.after_id = self.window.after(timer, tick)
+
+        handle.after_id = self.window.after(timer, tick)
+        return handle
+
     def cancel_timer(self, timer):
         """TODO docs"""
+        if isinstance(timer, RepeatingTimer):
+            timer.cancelled = True
+            timer = timer.after_id
         if timer is not None:
             self.window.after_cancel(timer)
 